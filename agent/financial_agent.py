@@ -4,15 +4,21 @@ from phi.model.google import Gemini
 from phi.tools.yfinance import YFinanceTools
 from phi.tools.duckduckgo import DuckDuckGo
 import google.generativeai as genai
+from model_router import answer_question, logger as router_logger
 from dotenv import load_dotenv
 load_dotenv()
 
+import logging
 import os
 
 API_KEY=os.getenv("GOOGLE_API_KEY")
 if API_KEY:
     genai.configure(api_key=API_KEY)
 
+# Print routing decisions and per-tier latency to the console
+logging.basicConfig(format="%(asctime)s [%(name)s] %(message)s")
+router_logger.setLevel(logging.INFO)
+
 # Page configuration
 st.set_page_config(
     page_title="Finance AI Agent",
@@ -21,14 +27,14 @@ st.set_page_config(
 )
 
 st.title("Finance AI Agent 📈💹")
-st.header("Powered by Gemini 2.0 Flash Exp")
+st.header("Powered by Gemini, with models picked by query complexity")
 
 @st.cache_resource
-def initialize_agents():
-    # Initialize a combined agent with both tools
+def initialize_agents(model_id):
+    # Initialize a combined agent with both tools, one per model tier
     return Agent(
         name="Combined Finance and Web Search AI Agent",
-        model=Gemini(id="gemini-2.0-flash-exp"),  # Use Gemini explicitly
+        model=Gemini(id=model_id),  # Use Gemini explicitly
         tools=[
             YFinanceTools(stock_price=True, analyst_recommendations=True, stock_fundamentals=True,company_news=True),  # Finance-related tools
             DuckDuckGo(),                    # Web search tool
@@ -44,9 +50,6 @@ def initialize_agents():
 
 
 
-
-multimodal_Agent=initialize_agents()
-
 def main():
     st.write(
         "This application combines multiple AI agents to analyze financial data and answer your questions."
@@ -64,11 +67,8 @@ def main():
         else:
             try:
                 with st.spinner("Processing your question..."):
-                    # Run the agent and get a response
-                    response = multimodal_Agent.run(question)
-
-                    # Access the response content as text (assuming it's in the 'content' field)
-                    response_text = response.content if hasattr(response, 'content') else str(response)
+                    # Route the question to a tier based on its complexity and get a response
+                    response_text = answer_question(question, initialize_agents)
 
                     # Display the result
                     st.subheader("Analysis Result")
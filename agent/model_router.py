@@ -0,0 +1,231 @@
+import logging
+import os
+import re
+import time
+from contextlib import contextmanager
+from typing import NamedTuple, Optional
+
+import yfinance as yf
+
+# Logger for routing decisions and per-tier latency; output is configured by the entry points
+logger = logging.getLogger(__name__)
+
+# Tiers, from cheapest to most expensive
+TRIVIAL = "trivial"  # answered straight from tool data, no LLM call
+MEDIUM = "medium"    # fast model
+HEAVY = "heavy"      # big model
+
+# Env var and default model id for each tier that calls a model
+MODEL_ID_SETTINGS = {
+    MEDIUM: ("FAST_MODEL_ID", "gemini-2.0-flash-lite"),
+    HEAVY: ("HEAVY_MODEL_ID", "gemini-2.0-flash"),
+}
+
+# Queries longer than this (in words) are treated as heavy analyses
+MAX_MEDIUM_QUERY_WORDS = 40
+# Context (e.g. a transcript) longer than this (in characters) needs the big model
+MAX_MEDIUM_CONTEXT_CHARS = 20000
+# A price lookup has to be short to be answered without the LLM
+MAX_TRIVIAL_QUERY_WORDS = 8
+
+HEAVY_KEYWORDS = re.compile(
+    r"\b(analy[sz]e|analysis|compare|comparison|versus|vs\.?|synthes\w*|summar\w*|"
+    r"forecast\w*|outlook|valuation|strategy|in[- ]depth|detailed|report|"
+    r"implications?|risks?|pros and cons|why|explain|thesis|deep dive)\b",
+    re.IGNORECASE,
+)
+PRICE_KEYWORDS = re.compile(
+    r"\b(price|quote|trading at|share price|stock price|how much is)\b",
+    re.IGNORECASE,
+)
+# The only words, besides one ticker, a question may contain to be answered from a current-price table
+TRIVIAL_ALLOWED_WORDS = {
+    "price", "quote", "trading", "at", "how", "much", "is", "what", "whats", "the", "of", "for",
+    "a", "current", "currently", "stock", "share", "now", "right", "me", "give", "show", "get",
+    "tell", "please",
+}
+# A whole word that is a ticker: BRK.B, BTC-USD, RELIANCE.NS, $AAPL
+TICKER_PATTERN = re.compile(r"\$?([A-Z][A-Z0-9]{0,9}(?:[.-][A-Z0-9]{1,5})?)")
+# Any uppercase run inside a word, used to spot ticker-like words we can't parse
+TICKER_FRAGMENT_PATTERN = re.compile(r"[A-Z]{2,}")
+WORD_STRIP_CHARS = "?!,;:\"'()[]"
+NON_TICKER_WORDS = {
+    "A", "I", "AI", "AND", "OR", "THE", "OF", "IS", "US", "USA", "USD", "EUR",
+    "CEO", "CFO", "ETF", "IPO", "EPS", "PE", "PEG", "GDP", "YTD", "NYSE", "NOW",
+    "WHAT", "HOW", "PRICE",
+}
+
+
+class Route(NamedTuple):
+    tier: str
+    model_id: Optional[str]
+    reason: str
+    symbol: Optional[str] = None
+
+
+def _clean_words(text):
+    """Split the text into words without surrounding punctuation or a possessive `'s`."""
+    words = []
+    for word in text.split():
+        word = word.strip(WORD_STRIP_CHARS).rstrip(".")
+        if word.endswith("'s"):
+            word = word[:-2]
+        if word:
+            words.append(word)
+    return words
+
+
+def _plain_price_symbol(query):
+    """
+    Return the ticker if the query asks for nothing but the current price of that one ticker.
+    Any word that isn't the ticker or in TRIVIAL_ALLOWED_WORDS (a currency, "premarket",
+    "options", a date...) means the table wouldn't answer the question, so None is returned.
+    """
+    if not PRICE_KEYWORDS.search(query):
+        return None
+    symbol = None
+    for word in _clean_words(query):
+        if word.lower() in TRIVIAL_ALLOWED_WORDS:
+            continue
+        match = TICKER_PATTERN.fullmatch(word)
+        if match is None or symbol is not None:
+            return None
+        symbol = match.group(1)
+    return symbol
+
+
+def _split_ticker_words(text):
+    """
+    Split the text into ticker symbols and ticker-like words that aren't valid symbols
+    (e.g. `^GSPC`, `BTC-USD-PERP`), which can't be looked up safely.
+    """
+    tickers, unparsed = [], []
+    for word in _clean_words(text):
+        match = TICKER_PATTERN.fullmatch(word)
+        if match:
+            symbol = match.group(1)
+            if symbol in NON_TICKER_WORDS and not word.startswith("$"):
+                continue
+            if symbol not in tickers:
+                tickers.append(symbol)
+        elif TICKER_FRAGMENT_PATTERN.search(word):
+            unparsed.append(word)
+    return tickers, unparsed
+
+
+def extract_tickers(text):
+    """Return the distinct ticker-like symbols mentioned in the text."""
+    return _split_ticker_words(text)[0]
+
+
+def model_id_for(tier):
+    """
+    Return the model id for a tier, or None for the trivial tier.
+    Read at call time so values loaded from `.env` after import are picked up.
+    """
+    if tier not in MODEL_ID_SETTINGS:
+        return None
+    env_var, default = MODEL_ID_SETTINGS[tier]
+    return os.getenv(env_var, default)
+
+
+def _route(tier, reason, symbol=None):
+    route = Route(tier=tier, model_id=model_id_for(tier), reason=reason, symbol=symbol)
+    logger.info("route tier=%s model=%s reason=%s", route.tier, route.model_id or "none", route.reason)
+    return route
+
+
+def classify_query(query, context_chars=0, allow_trivial=False):
+    """
+    Pick a tier for the query using local heuristics only.
+
+    `context_chars` is the size of any extra material sent with the query
+    (e.g. a transcript). Trivial routing is only considered when the caller
+    can answer price lookups from tool data (`allow_trivial=True`).
+    """
+    words = query.split()
+
+    if context_chars > MAX_MEDIUM_CONTEXT_CHARS:
+        return _route(HEAVY, f"context of {context_chars} chars")
+    if len(words) > MAX_MEDIUM_QUERY_WORDS:
+        return _route(HEAVY, f"query of {len(words)} words")
+
+    heavy_match = HEAVY_KEYWORDS.search(query)
+    if heavy_match:
+        return _route(HEAVY, f"keyword '{heavy_match.group(0).lower()}'")
+
+    # Only a plain "current price of one ticker" question skips the LLM; when in doubt, use the fast model
+    if allow_trivial and len(words) <= MAX_TRIVIAL_QUERY_WORDS:
+        symbol = _plain_price_symbol(query)
+        if symbol:
+            return _route(TRIVIAL, f"price lookup for {symbol}", symbol=symbol)
+
+    return _route(MEDIUM, "default")
+
+
+def fallback_route(reason):
+    """Route to the fast model when a trivial lookup couldn't be answered from tool data."""
+    return _route(MEDIUM, reason)
+
+
+def heavy_route(reason):
+    """Route straight to the big model, for requests that are heavy regardless of the query (e.g. whole videos)."""
+    return _route(HEAVY, reason)
+
+
+def answer_price_lookup(symbol):
+    """
+    Answer a trivial price lookup straight from Yahoo Finance, without an LLM call.
+    Returns None when the price or its currency can't be fetched so the caller can fall back to a model.
+    """
+    try:
+        info = yf.Ticker(symbol).info
+    except Exception as e:
+        logger.info("trivial lookup for %s failed: %s", symbol, e)
+        return None
+
+    price = info.get("regularMarketPrice", info.get("currentPrice"))
+    currency = info.get("currency")
+    if price is None or not currency:
+        logger.info("trivial lookup for %s failed: price=%s currency=%s", symbol, price, currency)
+        return None
+
+    return (
+        "| Symbol | Current Price |\n"
+        "|--------|---------------|\n"
+        f"| {symbol} | {float(price):,.2f} {currency} |\n\n"
+        "Source: Yahoo Finance"
+    )
+
+
+def answer_question(question, make_agent):
+    """
+    Answer a finance question on the cheapest tier that can handle it.
+    Plain price lookups come straight from Yahoo Finance; anything else, or a lookup
+    that fails, runs on the agent `make_agent(model_id)` returns for the routed model.
+    """
+    route = classify_query(question, allow_trivial=True)
+
+    if route.tier == TRIVIAL:
+        with log_latency(route):
+            response_text = answer_price_lookup(route.symbol)
+        if response_text is not None:
+            return response_text
+        route = fallback_route(f"no tool data for {route.symbol}")
+
+    with log_latency(route):
+        response = make_agent(route.model_id).run(question)
+
+    # Access the response content as text (assuming it's in the 'content' field)
+    return response.content if hasattr(response, 'content') else str(response)
+
+
+@contextmanager
+def log_latency(route):
+    """Log how long the request took on its tier."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        logger.info("latency tier=%s model=%s seconds=%.2f", route.tier, route.model_id or "none", elapsed)
@@ -4,17 +4,23 @@ from phi.model.google import Gemini
 from phi.tools.duckduckgo import DuckDuckGo
 from google.generativeai import upload_file,get_file
 import google.generativeai as genai
+from model_router import heavy_route, log_latency, logger as router_logger
 import time
 from pathlib import Path
 import tempfile
 from dotenv import load_dotenv
 load_dotenv()
+import logging
 import os
 
 API_KEY=os.getenv("GOOGLE_API_KEY")
 if API_KEY:
     genai.configure(api_key=API_KEY)
 
+# Print routing decisions and per-tier latency to the console
+logging.basicConfig(format="%(asctime)s [%(name)s] %(message)s")
+router_logger.setLevel(logging.INFO)
+
 # Page configuration
 st.set_page_config(
     page_title="Multimodal AI Agent- Video Summarizer",
@@ -23,23 +29,20 @@ st.set_page_config(
 )
 
 st.title("Phidata Video AI Summarizer Agent 🎥🎤🖬")
-st.header("Powered by Gemini 2.0 Flash Exp")
+st.header("Powered by Gemini, with models picked by query complexity")
 
 
 
 
 @st.cache_resource
-def initialize_agent():
+def initialize_agent(model_id):
     return Agent(
         name="Video AI Summarizer",
-        model=Gemini(id="gemini-2.0-flash-exp"),
+        model=Gemini(id=model_id),
         tools=[DuckDuckGo()],
         markdown=True,
     )
 
-## Initialize the agent
-multimodal_Agent=initialize_agent()
-
 # File uploader
 video_file = st.file_uploader(
     "Upload a video file", type=['mp4', 'mov', 'avi'], help="Upload a video for AI analysis"
@@ -81,8 +84,10 @@ if video_file:
                         """
                     )
 
-                    # AI agent processing
-                    response = multimodal_Agent.run(analysis_prompt, videos=[processed_video])
+                    # AI agent processing on the big model, since the whole video is sent along
+                    route = heavy_route("uploaded video")
+                    with log_latency(route):
+                        response = initialize_agent(route.model_id).run(analysis_prompt, videos=[processed_video])
 
                 # Display the result
                 st.subheader("Analysis Result")
@@ -3,8 +3,10 @@ from phi.agent import Agent
 from phi.model.google import Gemini
 from phi.tools.duckduckgo import DuckDuckGo
 import google.generativeai as genai
+from model_router import classify_query, log_latency, logger as router_logger
 from dotenv import load_dotenv
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled
+import logging
 import os
 
 # Load environment variables
@@ -14,6 +16,10 @@ API_KEY = os.getenv("GOOGLE_API_KEY")
 if API_KEY:
     genai.configure(api_key=API_KEY)
 
+# Print routing decisions and per-tier latency to the console
+logging.basicConfig(format="%(asctime)s [%(name)s] %(message)s")
+router_logger.setLevel(logging.INFO)
+
 # Page configuration
 st.set_page_config(
     page_title="Multimodal AI Agent - YouTube Video Agent",
@@ -22,7 +28,7 @@ st.set_page_config(
 )
 
 st.title("Phidata Video AI Summarizer Agent 🎥🎤🖬")
-st.header("Powered by Gemini 2.0 Flash Exp")
+st.header("Powered by Gemini, with models picked by query complexity")
 
 # Helper function to extract YouTube video ID
 def get_video_id(youtube_url):
@@ -52,15 +58,13 @@ def fetch_transcript(video_id):
 
 # Initialize Agent
 @st.cache_resource
-def initialize_agent():
+def initialize_agent(model_id):
     return Agent(
         name="YouTube Video AI Summarizer",
-        model=Gemini(id="gemini-2.0-flash-exp"),
+        model=Gemini(id=model_id),
         tools=[DuckDuckGo()],
         markdown=True,
     )
-# Instantiate the agent
-multimodal_Agent = initialize_agent()
 
 
 
@@ -111,8 +115,10 @@ if st.button("🔍 Analyze Video"):
                     Provide a clear, concise, and actionable response. Include references to both the transcript and additional web findings when needed.
                     """
 
-                    # Process the prompt using the AI agent
-                    response = multimodal_Agent.run(analysis_prompt)
+                    # Route by query and transcript size, then process the prompt using the AI agent
+                    route = classify_query(user_query, context_chars=len(transcript))
+                    with log_latency(route):
+                        response = initialize_agent(route.model_id).run(analysis_prompt)
 
                     # Display the results
                     st.subheader("Analysis Result")
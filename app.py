@@ -10,7 +10,10 @@ from pathlib import Path
 from PIL import Image
 from io import BytesIO
 import google.generativeai as genai
+from agent.model_router import answer_question, classify_query, log_latency
+from agent.model_router import logger as router_logger
 import tempfile
+import logging
 import os
 
 
@@ -21,6 +24,10 @@ TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 if API_KEY:
     genai.configure(api_key=API_KEY)
 
+# Print routing decisions and per-tier latency to the console
+logging.basicConfig(format="%(asctime)s [%(name)s] %(message)s")
+router_logger.setLevel(logging.INFO)
+
 # Page configuration
 st.set_page_config(
     page_title="Multimodal AI Agent",
@@ -33,10 +40,10 @@ st.title("Phidata Multimodal AI Agent 📈🎥💹")
 
 # Initialize finance agent
 @st.cache_resource
-def initialize_finance_agent():
+def initialize_finance_agent(model_id):
     return Agent(
         name="Finance AI Agent",
-        model=Gemini(id="gemini-2.0-flash"),
+        model=Gemini(id=model_id),
         tools=[YFinanceTools(stock_price=True, analyst_recommendations=True, stock_fundamentals=True, company_news=True),
                DuckDuckGo()],
         instructions=["Use DuckDuckGo for web searches.", "Provide financial data in tabular format.", "Always include sources for any information provided."],
@@ -47,10 +54,10 @@ def initialize_finance_agent():
 
 # Initialize YouTube video agent
 @st.cache_resource
-def initialize_youtube_agent():
+def initialize_youtube_agent(model_id):
     return Agent(
         name="YouTube Video Insights",
-        model=Gemini(id="gemini-2.0-flash"),
+        model=Gemini(id=model_id),
         tools=[DuckDuckGo()],
         markdown=True,
     )
@@ -86,9 +93,7 @@ def initialize_product_agent():
         markdown=True,
     )
 
-# Instantiate the agents
-finance_agent = initialize_finance_agent()
-youtube_agent = initialize_youtube_agent()
+# Instantiate the agents (finance and YouTube agents are created per model tier on demand)
 product_agent = initialize_product_agent()
 
 
@@ -135,8 +140,7 @@ if option == "Finance AI Agent":
         else:
             try:
                 with st.spinner("Processing your question..."):
-                    response = finance_agent.run(question)
-                    response_text = response.content if hasattr(response, 'content') else str(response)
+                    response_text = answer_question(question, initialize_finance_agent)
                     st.subheader("Analysis Result")
                     st.markdown(response_text)
             except Exception as e:
@@ -168,7 +172,9 @@ elif option == "YouTube Video Insights":
                     transcript = YouTubeTranscriptApi.get_transcript(video_id)
                     transcript_text = " ".join([item["text"] for item in transcript])
                     analysis_prompt = f"Analyze the following YouTube video transcript: {transcript_text} and answer the user query: {user_query}"
-                    response = youtube_agent.run(analysis_prompt)
+                    route = classify_query(user_query, context_chars=len(transcript_text))
+                    with log_latency(route):
+                        response = initialize_youtube_agent(route.model_id).run(analysis_prompt)
                     st.subheader("Analysis Result")
                     st.markdown(response.content)
             except TranscriptsDisabled:
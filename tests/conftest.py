@@ -0,0 +1,31 @@
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+AGENT_DIR = Path(__file__).resolve().parent.parent / "agent"
+
+
+@pytest.fixture
+def ticker_info():
+    """Info returned by the stubbed yfinance Ticker; tests can change it."""
+    return {"regularMarketPrice": 123.4567, "currency": "USD"}
+
+
+@pytest.fixture
+def model_router(monkeypatch, ticker_info):
+    """
+    Import agent/model_router.py the way the agent scripts do, with yfinance
+    stubbed for this test only so no network access is needed.
+    """
+    yfinance = types.ModuleType("yfinance")
+    yfinance.Ticker = lambda symbol: types.SimpleNamespace(info=ticker_info)
+    monkeypatch.setitem(sys.modules, "yfinance", yfinance)
+    monkeypatch.syspath_prepend(str(AGENT_DIR))
+    monkeypatch.delitem(sys.modules, "model_router", raising=False)
+
+    yield importlib.import_module("model_router")
+
+    sys.modules.pop("model_router", None)
@@ -0,0 +1,133 @@
+import types
+
+import pytest
+
+
+@pytest.mark.parametrize("query, symbol", [
+    ("price of TSLA", "TSLA"),
+    ("What's the stock price of $AAPL?", "AAPL"),
+    ("BRK.B price", "BRK.B"),
+    ("price of BTC-USD", "BTC-USD"),
+    ("Price of RELIANCE.NS", "RELIANCE.NS"),
+])
+def test_plain_price_lookup_is_trivial(model_router, query, symbol):
+    route = model_router.classify_query(query, allow_trivial=True)
+    assert route.tier == model_router.TRIVIAL
+    assert route.symbol == symbol
+    assert route.model_id is None
+
+
+@pytest.mark.parametrize("query", [
+    "What was the price of AAPL last year?",
+    "TSLA price in 2020",
+    "Is TSLA price up today?",
+    "price of AAPL since March",
+    "price of ^GSPC",
+    "price of BTC-USD-PERP",
+    "price of tesla",
+    "price of TSLA and AAPL",
+    "price of TSLA in EUR",
+    "premarket price of TSLA",
+    "price of TSLA options",
+    "price of TSLA puts",
+    "price of TSLA USD",
+    "latest news on NVDA",
+])
+def test_non_plain_lookup_is_medium(model_router, query):
+    assert model_router.classify_query(query, allow_trivial=True).tier == model_router.MEDIUM
+
+
+def test_trivial_requires_opt_in(model_router):
+    assert model_router.classify_query("price of TSLA").tier == model_router.MEDIUM
+
+
+@pytest.mark.parametrize("query", [
+    "Compare TSLA vs F",
+    "Summarize the key points",
+    "Why did NVDA rally?",
+    " ".join(["word"] * 41),
+])
+def test_analysis_is_heavy(model_router, query):
+    assert model_router.classify_query(query, allow_trivial=True).tier == model_router.HEAVY
+
+
+def test_context_chars_threshold(model_router):
+    limit = model_router.MAX_MEDIUM_CONTEXT_CHARS
+    assert model_router.classify_query("what is said", context_chars=limit).tier == model_router.MEDIUM
+    assert model_router.classify_query("what is said", context_chars=limit + 1).tier == model_router.HEAVY
+
+
+def test_heavy_route_uses_big_model(model_router):
+    route = model_router.heavy_route("uploaded video")
+    assert route.tier == model_router.HEAVY
+    assert route.reason == "uploaded video"
+    assert route.model_id == model_router.model_id_for(model_router.HEAVY)
+
+
+@pytest.mark.parametrize("text, tickers", [
+    ("price of BTC-USD", ["BTC-USD"]),
+    ("Price of RELIANCE.NS", ["RELIANCE.NS"]),
+    ("TSLA's price, then TSLA again", ["TSLA"]),
+    ("THE CEO of USD", []),
+    ("$USD", ["USD"]),
+])
+def test_extract_tickers(model_router, text, tickers):
+    assert model_router.extract_tickers(text) == tickers
+
+
+def test_model_ids_read_at_call_time(model_router, monkeypatch):
+    monkeypatch.setenv("FAST_MODEL_ID", "fast-model")
+    monkeypatch.setenv("HEAVY_MODEL_ID", "heavy-model")
+    assert model_router.classify_query("news on NVDA").model_id == "fast-model"
+    assert model_router.classify_query("Compare TSLA vs F").model_id == "heavy-model"
+
+
+def test_price_lookup_states_currency(model_router, ticker_info):
+    ticker_info.update(regularMarketPrice=2950.1, currency="INR")
+    answer = model_router.answer_price_lookup("RELIANCE.NS")
+    assert "| RELIANCE.NS | 2,950.10 INR |" in answer
+    assert "Yahoo Finance" in answer
+
+
+@pytest.mark.parametrize("info", [
+    {"currency": "USD"},
+    {"regularMarketPrice": 123.45},
+])
+def test_price_lookup_without_price_or_currency_is_skipped(model_router, ticker_info, info):
+    ticker_info.clear()
+    ticker_info.update(info)
+    assert model_router.answer_price_lookup("XYZ") is None
+
+
+def test_failed_price_lookup_falls_back_to_fast_model(model_router, ticker_info):
+    ticker_info.clear()
+    assert model_router.answer_price_lookup("XYZ") is None
+    route = model_router.fallback_route("no tool data for XYZ")
+    assert route.tier == model_router.MEDIUM
+    assert route.model_id == model_router.model_id_for(model_router.MEDIUM)
+
+
+class FakeAgent:
+    def __init__(self, model_id):
+        self.model_id = model_id
+
+    def run(self, question):
+        return types.SimpleNamespace(content=f"{self.model_id}: {question}")
+
+
+def test_answer_question_skips_agent_for_price_lookup(model_router):
+    def make_agent(model_id):
+        raise AssertionError("no agent should be built for a plain price lookup")
+
+    assert "| TSLA | 123.46 USD |" in model_router.answer_question("price of TSLA", make_agent)
+
+
+def test_answer_question_falls_back_to_fast_agent(model_router, ticker_info):
+    ticker_info.clear()
+    fast_model = model_router.model_id_for(model_router.MEDIUM)
+    assert model_router.answer_question("price of XYZ", FakeAgent) == f"{fast_model}: price of XYZ"
+
+
+def test_answer_question_runs_heavy_agent(model_router):
+    heavy_model = model_router.model_id_for(model_router.HEAVY)
+    assert model_router.answer_question("Compare TSLA vs F", FakeAgent) == f"{heavy_model}: Compare TSLA vs F"